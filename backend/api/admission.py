@@ -0,0 +1,21 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from backend.middleware.admission import get_admission_stats
+from backend.utils.camelcase import to_camel
+
+router = APIRouter(prefix="/admission", tags=["Admission"])
+
+@router.get("/stats")
+def admission_stats():
+    """
+    Retrieve queue depth and rejection counters for each route class.
+
+    Returns:
+        dict: Counters of the "read", "write" and "bulk" route classes.
+    """
+    return {
+        name: {to_camel(key): value for key, value in asdict(stats).items()}
+        for name, stats in get_admission_stats().items()
+    }
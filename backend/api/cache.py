@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+
+from backend.services.cache import get_cache
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+@router.get("/stats")
+def cache_stats():
+    """
+    Retrieve hit/miss statistics of the result cache.
+
+    Returns:
+        dict: Counters of the active cache backend plus the hit ratio.
+    """
+    stats = get_cache().stats()
+    return {
+        "hits": stats.hits,
+        "misses": stats.misses,
+        "hitRatio": stats.hit_ratio,
+        "evictions": stats.evictions,
+        "expirations": stats.expirations,
+        "invalidations": stats.invalidations,
+        "size": stats.size,
+        "maxsize": stats.maxsize,
+    }
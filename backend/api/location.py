@@ -0,0 +1,20 @@
+from sqlmodel import Session
+from typing import List
+from fastapi import APIRouter, Depends
+from backend.database import get_session
+from backend.services import location_service
+
+router = APIRouter(prefix="/locations", tags=["LocationRead"])
+
+@router.get("/", response_model=List[str])
+def list_locations(session: Session = Depends(get_session)):
+    """
+    Retrieve the names of all locations.
+
+    Args:
+        session (Session): Database session dependency.
+
+    Returns:
+        List[str]: List of location names.
+    """
+    return location_service.get_locations(session)
@@ -2,14 +2,16 @@ from backend.models.biosample import BioSample
 from backend.schemas.biosample import BioSampleCreate, BioSampleRead
 from backend.services.operator_service import get_or_create_operator
 from backend.services.sampletype_service import get_or_create_sample_type
+from backend.services.location_service import get_or_create_location
 from sqlmodel import Session
 
 
 def from_biosample_create(session: Session, data: BioSampleCreate) -> BioSample:
     operator = get_or_create_operator(session, data.operator_name)
     sample_type = get_or_create_sample_type(session, data.sample_type_name)
+    location = get_or_create_location(session, data.location)
     return BioSample(
-        location=data.location,
+        location_id=location.id,
         sampling_date=data.sampling_date,
         operator_id=operator.id,
         type_id=sample_type.id,
@@ -19,7 +21,7 @@ def from_biosample_create(session: Session, data: BioSampleCreate) -> BioSample:
 def to_biosample_read(biosample: BioSample) -> BioSampleRead:
     return BioSampleRead(
         id=biosample.id,
-        location=biosample.location,
+        location=biosample.location.name,
         sampling_date=biosample.sampling_date,
         operator_name=biosample.operator.name,
         sample_type_name=biosample.sample_type.name,
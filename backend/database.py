@@ -1,10 +1,12 @@
 from sqlmodel import SQLModel, create_engine, Session
+from backend.migrations.location import check_locations_migrated
 
 sqlite_url = "sqlite:///./biosample.db"
 engine = create_engine(sqlite_url, echo=True)
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    check_locations_migrated(engine)
 
 def get_session():
     with Session(engine) as session:
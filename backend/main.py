@@ -2,12 +2,16 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
-from .api import biosample, comment, operator, sampletype
+from .api import admission, biosample, cache, comment, location, operator, sampletype
 from .database import init_db
+from .middleware.admission import AdmissionControlMiddleware, configure_admission, configure_threadpool
 from .services.exceptions import EntityNotFoundError  # la tua eccezione personalizzata
 
 app = FastAPI()
 
+# Admission control, added before CORS so that 503 rejections still carry CORS headers
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS Middleware come già hai fatto
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +23,8 @@ app.add_middleware(
 
 @app.on_event("startup")
 def on_startup():
+    configure_admission()
+    configure_threadpool()
     init_db()
 
 # Handler globale per EntityNotFoundError
@@ -34,3 +40,6 @@ app.include_router(biosample.router)
 app.include_router(comment.router)
 app.include_router(operator.router)
 app.include_router(sampletype.router)
+app.include_router(location.router)
+app.include_router(cache.router)
+app.include_router(admission.router)
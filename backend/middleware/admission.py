@@ -0,0 +1,204 @@
+"""
+Admission control for the API.
+
+All route handlers are sync functions executed in anyio's worker threadpool.
+Without a limit, an overloaded server queues requests indefinitely and cheap
+reads wait behind slow bulk calls. This middleware splits requests into
+route classes (reads, writes, bulk/admin), each with its own concurrency
+limit and bounded wait queue; when a queue is full, or a request waited
+too long, it is rejected immediately with ``503`` and a ``Retry-After`` header.
+"""
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict
+
+import anyio.to_thread
+
+READ = "read"
+WRITE = "write"
+BULK = "bulk"
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+BULK_PATH_PREFIXES = ("/biosamples/generate/",)
+EXEMPT_PATHS = {"/admission/stats", "/cache/stats", "/docs", "/openapi.json"}
+
+
+@dataclass
+class AdmissionStats:
+    """
+    Snapshot of the counters of one route class.
+
+    Attributes:
+        limit (int): Maximum number of requests handled concurrently.
+        max_queue (int): Maximum number of requests waiting for a slot.
+        in_flight (int): Requests currently being handled.
+        queued (int): Requests currently waiting for a slot.
+        admitted (int): Total requests that obtained a slot.
+        rejected (int): Total requests rejected because the queue was full.
+        timed_out (int): Total requests rejected after waiting longer than the queue timeout.
+    """
+
+    limit: int
+    max_queue: int
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+
+
+class AdmissionGate:
+    """
+    Concurrency limit with a bounded wait queue for one route class.
+
+    Only touched from the event loop thread, so plain counters are enough.
+
+    Args:
+        limit (int): Maximum number of requests handled concurrently.
+        max_queue (int): Maximum number of requests allowed to wait for a slot.
+        queue_timeout (float): Seconds a request may wait for a slot before being rejected.
+
+    Raises:
+        ValueError: If limit is below 1 or max_queue is negative.
+    """
+
+    def __init__(self, limit: int, max_queue: int, queue_timeout: float):
+        if limit < 1:
+            raise ValueError(f"admission limit must be at least 1, got {limit}")
+        if max_queue < 0:
+            raise ValueError(f"admission queue size cannot be negative, got {max_queue}")
+        self.queue_timeout = queue_timeout
+        self.stats = AdmissionStats(limit=limit, max_queue=max_queue)
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        """Wait for a slot; return False if the request must be rejected."""
+        # Counters are updated synchronously, unlike the semaphore which is only
+        # taken once the acquiring task gets scheduled.
+        if self.stats.in_flight + self.stats.queued >= self.stats.limit + self.stats.max_queue:
+            self.stats.rejected += 1
+            return False
+        self.stats.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            return False
+        finally:
+            self.stats.queued -= 1
+        self.stats.in_flight += 1
+        self.stats.admitted += 1
+        return True
+
+    def release(self) -> None:
+        self.stats.in_flight -= 1
+        self._semaphore.release()
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def build_gates() -> Dict[str, AdmissionGate]:
+    """Create one gate per route class, configured from environment variables."""
+    queue_timeout = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "5"))
+    return {
+        READ: AdmissionGate(_env_int("ADMISSION_READ_LIMIT", 24), _env_int("ADMISSION_READ_QUEUE", 100), queue_timeout),
+        WRITE: AdmissionGate(_env_int("ADMISSION_WRITE_LIMIT", 8), _env_int("ADMISSION_WRITE_QUEUE", 50), queue_timeout),
+        BULK: AdmissionGate(_env_int("ADMISSION_BULK_LIMIT", 2), _env_int("ADMISSION_BULK_QUEUE", 4), queue_timeout),
+    }
+
+
+# Gates hold asyncio semaphores, which bind to the event loop that first waits
+# on them, so they are built per loop at startup rather than at import time.
+_gates: Dict[str, AdmissionGate] = {}
+_gates_loop: asyncio.AbstractEventLoop | None = None
+
+
+def configure_admission() -> None:
+    """Build the gates for the running event loop from the ADMISSION_* environment variables."""
+    global _gates, _gates_loop
+    _gates = build_gates()
+    _gates_loop = asyncio.get_running_loop()
+
+
+def get_gates() -> Dict[str, AdmissionGate]:
+    """Return the gates of the running event loop, building them if the app is served in a new loop."""
+    if _gates_loop is not asyncio.get_running_loop():
+        configure_admission()
+    return _gates
+
+
+def classify(method: str, path: str) -> str:
+    """Return the route class of a request."""
+    if path.startswith(BULK_PATH_PREFIXES):
+        return BULK
+    return READ if method in READ_METHODS else WRITE
+
+
+def get_admission_stats() -> Dict[str, AdmissionStats]:
+    """Return the counters of every route class."""
+    return {name: gate.stats for name, gate in _gates.items()}
+
+
+def configure_threadpool(size: int | None = None) -> None:
+    """
+    Set the size of the worker threadpool used for sync handlers (anyio default: 40).
+
+    Must run in the event loop, after configure_admission().
+
+    Raises:
+        RuntimeError: If the threadpool is smaller than the sum of the gate limits, in which
+            case admitted requests of one class could wait for threads held by another.
+    """
+    size = size if size is not None else _env_int("THREADPOOL_SIZE", 40)
+    admitted = sum(gate.stats.limit for gate in get_gates().values())
+    if size < admitted:
+        raise RuntimeError(
+            f"THREADPOOL_SIZE ({size}) is smaller than the sum of the ADMISSION_*_LIMIT values ({admitted}); "
+            f"raise the threadpool size or lower the limits"
+        )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware that admits HTTP requests through the gate of their route class.
+
+    Args:
+        app: The wrapped ASGI application.
+        retry_after (int): Seconds suggested to rejected clients in the Retry-After header.
+    """
+
+    def __init__(self, app, retry_after: int | None = None):
+        self.app = app
+        self.retry_after = retry_after if retry_after is not None else _env_int("ADMISSION_RETRY_AFTER_SECONDS", 1)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        gate = get_gates()[classify(scope["method"], scope["path"])]
+        if not await gate.acquire():
+            await self._reject(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+    async def _reject(self, send) -> None:
+        body = json.dumps({"detail": "Server overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
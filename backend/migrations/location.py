@@ -0,0 +1,170 @@
+"""
+Online migration from the free-form ``biosample.location`` string column to
+the normalized ``location`` table referenced by ``biosample.location_id``.
+
+The migration follows an expand / backfill / contract sequence so that it
+can run while the previous application version keeps serving traffic:
+
+1. expand: add the nullable ``location_id`` column and its index;
+2. backfill: in short batches, get-or-create the Location rows for
+   biosamples without a ``location_id`` and link them (each batch is its own
+   transaction, so the SQLite write lock is released between batches and
+   rows inserted meanwhile by the old version are picked up by later batches);
+3. contract: once nothing is left to backfill, rebuild the table without the
+   legacy string column and with ``location_id NOT NULL``, so a migrated
+   database ends up with the same schema as a freshly created one.
+
+Every step is idempotent, so an interrupted run resumes where it stopped.
+The contract step rewrites the whole table while holding the write lock, so
+it is never run at startup: ``init_db`` only checks that the migration is done.
+Backfill ahead of a deploy while the old version is still live, then stop it
+and contract:
+
+    python -m backend.migrations.location --database-url sqlite:///./biosample.db --keep-legacy-column
+    python -m backend.migrations.location --database-url sqlite:///./biosample.db
+"""
+import argparse
+import logging
+from typing import List
+
+from sqlalchemy import MetaData, create_engine, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateTable
+
+from backend.models.biosample import BioSample
+from backend.models.location import Location
+from backend.models.operator import Operator
+from backend.models.sampletype import SampleType
+
+LEGACY_COLUMN = "location"
+INDEX_NAME = "ix_biosample_location_id"
+
+logger = logging.getLogger(__name__)
+
+
+def _biosample_columns(engine: Engine) -> List[str]:
+    inspector = inspect(engine)
+    if not inspector.has_table("biosample"):
+        return []
+    return [column["name"] for column in inspector.get_columns("biosample")]
+
+
+def expand(engine: Engine) -> None:
+    """Add the location_id column and its index to a pre-existing biosample table."""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE biosample ADD COLUMN location_id INTEGER REFERENCES location (id)"))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON biosample (location_id)"))
+
+
+def backfill_batch(engine: Engine, batch_size: int) -> int:
+    """Link up to batch_size unmigrated biosamples to their Location rows and return how many were updated."""
+    with engine.begin() as conn:
+        ids = conn.execute(
+            text("SELECT id FROM biosample WHERE location_id IS NULL ORDER BY id LIMIT :limit"),
+            {"limit": batch_size},
+        ).scalars().all()
+        if not ids:
+            return 0
+        first_id, last_id = ids[0], ids[-1]
+        params = {"first_id": first_id, "last_id": last_id}
+        conn.execute(
+            text(
+                "INSERT OR IGNORE INTO location (name) "
+                f"SELECT DISTINCT {LEGACY_COLUMN} FROM biosample "
+                "WHERE location_id IS NULL AND id BETWEEN :first_id AND :last_id"
+            ),
+            params,
+        )
+        conn.execute(
+            text(
+                "UPDATE biosample SET location_id = "
+                f"(SELECT location.id FROM location WHERE location.name = biosample.{LEGACY_COLUMN}) "
+                "WHERE location_id IS NULL AND id BETWEEN :first_id AND :last_id"
+            ),
+            params,
+        )
+        return len(ids)
+
+
+def contract(engine: Engine) -> None:
+    """
+    Rebuild the biosample table with the current model schema, dropping the legacy location column.
+
+    Uses SQLite's create / copy / drop / rename procedure inside one transaction,
+    so the whole table is rewritten while the write lock is held.
+
+    Raises:
+        RuntimeError: If some biosample still has no location_id.
+    """
+    # Referenced tables are copied along so that the foreign keys can be rendered.
+    metadata = MetaData()
+    for model in (Location, Operator, SampleType):
+        model.__table__.to_metadata(metadata)
+    new_table = BioSample.__table__.to_metadata(metadata, name="biosample_new")
+    columns = ", ".join(column.name for column in new_table.columns)
+    with engine.begin() as conn:
+        unlinked = conn.execute(text("SELECT COUNT(*) FROM biosample WHERE location_id IS NULL")).scalar()
+        if unlinked:
+            raise RuntimeError(f"{unlinked} biosamples have no location_id; run the backfill before contracting")
+        conn.execute(text("DROP TABLE IF EXISTS biosample_new"))  # left over by an interrupted run
+        conn.execute(CreateTable(new_table))
+        conn.execute(text(f"INSERT INTO biosample_new ({columns}) SELECT {columns} FROM biosample"))
+        conn.execute(text("DROP TABLE biosample"))
+        conn.execute(text("ALTER TABLE biosample_new RENAME TO biosample"))
+        conn.execute(text(f"CREATE INDEX {INDEX_NAME} ON biosample (location_id)"))
+
+
+def migrate_locations(engine: Engine, batch_size: int = 5000, keep_legacy_column: bool = False) -> None:
+    """
+    Bring an existing database to the normalized Location schema.
+
+    Args:
+        engine (Engine): Engine of the database to migrate; the location table must already exist.
+        batch_size (int): Number of biosamples linked per transaction.
+        keep_legacy_column (bool): Stop after the backfill, leaving the old column for a still-running old version.
+    """
+    columns = _biosample_columns(engine)
+    if LEGACY_COLUMN not in columns:
+        logger.info("biosample table already uses the Location table, nothing to do")
+        return
+    if "location_id" not in columns:
+        logger.info("adding biosample.location_id")
+        expand(engine)
+    linked = 0
+    while updated := backfill_batch(engine, batch_size):
+        linked += updated
+        logger.info("backfilled %d biosamples", linked)
+    if not keep_legacy_column:
+        logger.info("rebuilding biosample without the legacy location column; writes are blocked until done")
+        contract(engine)
+        logger.info("location migration complete")
+
+
+def check_locations_migrated(engine: Engine) -> None:
+    """
+    Make sure the biosample table no longer has the legacy location column.
+
+    Raises:
+        RuntimeError: If the database still needs the location migration.
+    """
+    if LEGACY_COLUMN in _biosample_columns(engine):
+        raise RuntimeError(
+            "The biosample table still has the legacy location column. Run "
+            "`python -m backend.migrations.location --database-url <url>` before starting the application."
+        )
+
+
+if __name__ == "__main__":
+    from sqlmodel import SQLModel
+
+    parser = argparse.ArgumentParser(description="Migrate biosample locations to the Location table.")
+    parser.add_argument("--database-url", default="sqlite:///./biosample.db", help="SQLAlchemy database URL")
+    parser.add_argument("--batch-size", type=int, default=5000, help="biosamples linked per transaction")
+    parser.add_argument("--keep-legacy-column", action="store_true",
+                        help="only expand and backfill, leaving the old location column in place")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    engine = create_engine(args.database_url)
+    SQLModel.metadata.create_all(engine, tables=[Location.__table__])
+    migrate_locations(engine, args.batch_size, args.keep_legacy_column)
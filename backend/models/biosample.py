@@ -8,23 +8,24 @@ class BioSample(SQLModel, table=True):
 
     Attributes:
         id (Optional[int]): Primary key.
-        location (str): Sample collection location.
         sampling_date (date): Date of sample collection.
         created_at (datetime): Timestamp of record creation, default is current UTC time.
         type_id (int): Foreign key referencing SampleType.
         operator_id (int): Foreign key referencing Operator.
+        location_id (int): Indexed foreign key referencing Location.
         sample_type (Optional[SampleType]): Related sample type, eager loaded.
         operator (Optional[Operator]): Related operator who collected the sample, eager loaded.
+        location (Optional[Location]): Related collection location, eager loaded.
         comments (List[Comment]): Comments associated with this biosample.
     """
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    location: str
     sampling_date: date
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     type_id: int = Field(foreign_key="sampletype.id")
     operator_id: int = Field(foreign_key="operator.id")
+    location_id: int = Field(foreign_key="location.id", index=True)
 
     sample_type: Optional["SampleType"] = Relationship(
         back_populates="biosamples",
@@ -34,6 +35,10 @@ class BioSample(SQLModel, table=True):
         back_populates="biosamples",
         sa_relationship_kwargs={"lazy": "joined"}  # eager load to reduce queries
     )
+    location: Optional["Location"] = Relationship(
+        back_populates="biosamples",
+        sa_relationship_kwargs={"lazy": "joined"}  # eager load to reduce queries
+    )
     comments: List["Comment"] = Relationship(
         back_populates="biosample"
     )
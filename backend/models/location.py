@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field, Relationship
+from typing import Optional, List
+
+class Location(SQLModel, table=True):
+    """
+    Represents a location where biosamples are collected.
+
+    Attributes:
+        id (Optional[int]): Primary key.
+        name (str): Unique name of the location.
+        biosamples (List[BioSample]): List of biosamples collected at this location.
+    """
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True, unique=True)
+
+    biosamples: List["BioSample"] = Relationship(back_populates="location")
@@ -0,0 +1,231 @@
+"""
+Deterministic synthetic data generator for scale testing.
+
+Writes operators, sample types, biosamples and comments straight into the
+database with batched bulk inserts, bypassing the per-row service layer.
+The same seed and options always produce identical rows, so databases built
+on different machines can be compared in benchmarks.
+
+Usage (from the project root):
+    python -m backend.scripts.generate_data --samples 1000000 --seed 42 --database-url sqlite:///./bench.db
+
+By default the data goes to a separate ./bench.db, never the application
+database. SQLite durability (rollback journal, fsync) is only relaxed when
+the script creates the database file itself, or with --unsafe-fast.
+Identical output is only guaranteed on an empty database: the script refuses
+to run against existing biosamples unless --append is passed.
+"""
+import argparse
+import math
+import os
+import time
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from random import Random
+from typing import Dict, Iterator, List
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlmodel import SQLModel
+
+from backend.models.biosample import BioSample
+from backend.models.comment import Comment
+from backend.models.location import Location
+from backend.models.operator import Operator
+from backend.models.sampletype import SampleType
+
+AUTHORS = ["alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi"]
+WORDS = [
+    "sample", "checked", "contamination", "stored", "fridge", "label", "ok",
+    "repeat", "analysis", "pending", "validated", "batch", "temperature", "note",
+]
+
+
+class WeightedChoice:
+    """
+    Draws indexes 0..n-1 with a Zipf-like skew: weight(i) = 1 / (i + 1) ** skew.
+
+    A skew of 0 gives a uniform distribution; larger values concentrate
+    draws on the first few values.
+    """
+
+    def __init__(self, n: int, skew: float):
+        self.cumulative = list(accumulate(1.0 / (i + 1) ** skew for i in range(n)))
+        self.total = self.cumulative[-1]
+
+    def draw(self, rng: Random) -> int:
+        return min(bisect(self.cumulative, rng.random() * self.total), len(self.cumulative) - 1)
+
+
+def poisson(rng: Random, mean: float) -> int:
+    """Draw from a Poisson distribution (Knuth's method, fine for small means)."""
+    if mean <= 0:
+        return 0
+    limit = math.exp(-mean)
+    k, p = 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def get_or_create_names(conn: Connection, model, names: List[str]) -> List[int]:
+    """Return the ids of the given names in a lookup table, inserting the missing ones."""
+    table = model.__table__
+    existing: Dict[str, int] = dict(
+        conn.execute(select(table.c.name, table.c.id).where(table.c.name.in_(names))).all()
+    )
+    missing = [name for name in names if name not in existing]
+    if missing:
+        conn.execute(insert(table), [{"name": name} for name in missing])
+        existing.update(
+            conn.execute(select(table.c.name, table.c.id).where(table.c.name.in_(missing))).all()
+        )
+    return [existing[name] for name in names]
+
+
+def next_id(conn: Connection, model) -> int:
+    """Return the first free primary key of a table."""
+    return (conn.execute(select(func.max(model.__table__.c.id))).scalar() or 0) + 1
+
+
+def generate_rows(args: argparse.Namespace, operator_ids: List[int], type_ids: List[int],
+                  location_ids: List[int], first_sample_id: int, first_comment_id: int) -> Iterator[tuple]:
+    """Yield (biosample_row, comment_rows) pairs, fully determined by args.seed."""
+    rng = Random(args.seed)
+    operators = WeightedChoice(len(operator_ids), args.skew)
+    sample_types = WeightedChoice(len(type_ids), args.skew)
+    locations = WeightedChoice(len(location_ids), args.skew)
+    start = date.fromisoformat(args.start_date)
+    base_created = datetime.combine(start, datetime.min.time())
+
+    comment_id = first_comment_id
+    for offset in range(args.samples):
+        sample_id = first_sample_id + offset
+        day = rng.randrange(args.days)
+        sampling_date = start + timedelta(days=day)
+        created_at = base_created + timedelta(days=day + 1, seconds=rng.randrange(86400))
+        biosample = {
+            "id": sample_id,
+            "sampling_date": sampling_date,
+            "created_at": created_at,
+            "operator_id": operator_ids[operators.draw(rng)],
+            "type_id": type_ids[sample_types.draw(rng)],
+            "location_id": location_ids[locations.draw(rng)],
+        }
+
+        comments = []
+        for _ in range(min(poisson(rng, args.comments_mean), args.comments_max)):
+            comments.append({
+                "id": comment_id,
+                "biosample_id": sample_id,
+                "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12))),
+                "author": rng.choice(AUTHORS),
+                "created_at": created_at + timedelta(minutes=rng.randrange(60 * 24 * 30)),
+            })
+            comment_id += 1
+        yield biosample, comments
+
+
+def is_new_sqlite_file(database_url: str) -> bool:
+    """Tell whether database_url is a SQLite database that does not exist yet (or lives in memory)."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return not url.database or url.database == ":memory:" or not os.path.exists(url.database)
+
+
+def configure_fast_sqlite(engine: Engine) -> None:
+    """Disable the rollback journal and fsync on SQLite connections; an interrupted run can corrupt the file."""
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.close()
+
+
+def generate(args: argparse.Namespace) -> None:
+    """Create the schema if needed and bulk insert the synthetic dataset."""
+    unsafe_fast = args.unsafe_fast or is_new_sqlite_file(args.database_url)
+    engine = create_engine(args.database_url)
+    if unsafe_fast and engine.dialect.name == "sqlite":
+        configure_fast_sqlite(engine)
+    SQLModel.metadata.create_all(engine)
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(BioSample.__table__)).scalar()
+        if existing and not args.append:
+            raise SystemExit(
+                f"{args.database_url} already contains {existing} biosamples; the generated ids would shift "
+                f"and the data would not match other runs with the same seed. Use an empty database or --append."
+            )
+        operator_ids = get_or_create_names(conn, Operator, [f"operator-{i:04d}" for i in range(args.operators)])
+        type_ids = get_or_create_names(conn, SampleType, [f"type-{i:04d}" for i in range(args.sample_types)])
+        location_ids = get_or_create_names(conn, Location, [f"location-{i:05d}" for i in range(args.locations)])
+        first_sample_id = next_id(conn, BioSample)
+        first_comment_id = next_id(conn, Comment)
+
+    samples_batch, comments_batch = [], []
+    total_samples = total_comments = 0
+    rows = generate_rows(args, operator_ids, type_ids, location_ids, first_sample_id, first_comment_id)
+    with engine.connect() as conn:
+        for biosample, comments in rows:
+            samples_batch.append(biosample)
+            comments_batch.extend(comments)
+            if len(samples_batch) >= args.batch_size:
+                total_samples, total_comments = flush(conn, samples_batch, comments_batch,
+                                                      total_samples, total_comments, started)
+        flush(conn, samples_batch, comments_batch, total_samples, total_comments, started)
+
+
+def flush(conn: Connection, samples: List[dict], comments: List[dict],
+          total_samples: int, total_comments: int, started: float) -> tuple:
+    """Insert one batch of biosamples and comments in a single transaction and clear the buffers."""
+    if not samples:
+        return total_samples, total_comments
+    conn.execute(insert(BioSample.__table__), samples)
+    if comments:
+        conn.execute(insert(Comment.__table__), comments)
+    conn.commit()
+    total_samples += len(samples)
+    total_comments += len(comments)
+    samples.clear()
+    comments.clear()
+    print(f"{total_samples} biosamples, {total_comments} comments ({time.perf_counter() - started:.1f}s)")
+    return total_samples, total_comments
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic BioSample dataset.")
+    parser.add_argument("--database-url", default="sqlite:///./bench.db",
+                        help="SQLAlchemy database URL (default: a separate ./bench.db)")
+    parser.add_argument("--append", action="store_true",
+                        help="add to a database that already contains biosamples (output is then not reproducible)")
+    parser.add_argument("--unsafe-fast", action="store_true",
+                        help="disable SQLite journaling and fsync even on an existing database file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed; the same seed yields identical data")
+    parser.add_argument("--samples", type=int, default=100_000, help="number of biosamples to generate")
+    parser.add_argument("--operators", type=int, default=50, help="number of distinct operators")
+    parser.add_argument("--sample-types", type=int, default=20, help="number of distinct sample types")
+    parser.add_argument("--locations", type=int, default=200, help="number of distinct locations")
+    parser.add_argument("--skew", type=float, default=1.0,
+                        help="Zipf exponent for operators, sample types and locations (0 = uniform)")
+    parser.add_argument("--start-date", default="2020-01-01", help="first sampling date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=365 * 5, help="number of days covered by sampling dates")
+    parser.add_argument("--comments-mean", type=float, default=1.5, help="mean comments per biosample (Poisson)")
+    parser.add_argument("--comments-max", type=int, default=20, help="maximum comments per biosample")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="biosamples inserted per transaction")
+    args = parser.parse_args(argv)
+    for name in ("operators", "sample_types", "locations", "days", "batch_size"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+    return args
+
+
+if __name__ == "__main__":
+    generate(parse_args())
@@ -10,7 +10,21 @@ from backend.models.biosample import BioSample
 from backend.schemas.biosample import BioSampleCreate, BioSampleUpdate, BioSampleRead
 from backend.services.operator_service import get_or_create_operator
 from backend.services.sampletype_service import get_or_create_sample_type
+from backend.services.location_service import get_or_create_location
 from backend.services.comment_service import delete_comments_for_sample
+from backend.services.cache import cached, get_cache
+
+LIST_NAMESPACE = "biosample:list"
+COUNT_NAMESPACE = "biosample:count"
+DETAIL_NAMESPACE = "biosample:detail"
+
+def invalidate_biosample_cache(biosample_id: Optional[int] = None) -> None:
+    """Drop cached list pages and counts, plus the detail entry of biosample_id if given."""
+    cache = get_cache()
+    cache.invalidate_namespace(LIST_NAMESPACE)
+    cache.invalidate_namespace(COUNT_NAMESPACE)
+    if biosample_id is not None:
+        cache.delete((DETAIL_NAMESPACE, biosample_id))
 
 def create_biosample(session: Session, data: BioSampleCreate) -> BioSampleRead:
     """Create a new biosample from input data."""
@@ -18,11 +32,15 @@ def create_biosample(session: Session, data: BioSampleCreate) -> BioSampleRead:
     session.add(biosample)
     session.commit()
     session.refresh(biosample)
+    invalidate_biosample_cache()
     return to_biosample_read(biosample)
 
 def count_biosamples(session: Session) -> int:
     """Count the total number of BioSample records in the database."""
-    return session.exec(select(func.count()).select_from(BioSample)).one()
+    return cached(
+        (COUNT_NAMESPACE,),
+        lambda: session.exec(select(func.count()).select_from(BioSample)).one(),
+    )
 
 
 def generate_random_biosample_data():
@@ -49,14 +67,20 @@ def generate_multiple_biosamples(session: Session, n: int) -> List[BioSampleRead
 
 def list_biosamples(session: Session, limit: int = 10, offset: int = 0) -> List[BioSampleRead]:
     """Return a paginated list of biosamples."""
-    stmt = select(BioSample).order_by(BioSample.created_at.desc()).offset(offset).limit(limit)
-    results = session.exec(stmt).all()
-    return [to_biosample_read(bs) for bs in results]
+    def load() -> List[BioSampleRead]:
+        stmt = select(BioSample).order_by(BioSample.created_at.desc()).offset(offset).limit(limit)
+        results = session.exec(stmt).all()
+        return [to_biosample_read(bs) for bs in results]
+
+    return list(cached((LIST_NAMESPACE, limit, offset), load))
 
 def get_biosample(session: Session, biosample_id: int) -> Optional[BioSampleRead]:
     """Fetch a single biosample by ID."""
-    biosample = session.get(BioSample, biosample_id)
-    return to_biosample_read(biosample) if biosample else None
+    def load() -> Optional[BioSampleRead]:
+        biosample = session.get(BioSample, biosample_id)
+        return to_biosample_read(biosample) if biosample else None
+
+    return cached((DETAIL_NAMESPACE, biosample_id), load)
 
 def update_biosample(session: Session, biosample_id: int, data: BioSampleUpdate) -> Optional[BioSampleRead]:
     """Update an existing biosample."""
@@ -70,11 +94,15 @@ def update_biosample(session: Session, biosample_id: int, data: BioSampleUpdate)
     if "sample_type_name" in update_data:
         sample_type = get_or_create_sample_type(session, update_data.pop("sample_type_name"))
         biosample.type_id = sample_type.id
+    if "location" in update_data:
+        location = get_or_create_location(session, update_data.pop("location"))
+        biosample.location_id = location.id
     for key, value in update_data.items():
         setattr(biosample, key, value)
     session.add(biosample)
     session.commit()
     session.refresh(biosample)
+    invalidate_biosample_cache(biosample_id)
     return to_biosample_read(biosample)
 
 def delete_biosample(session: Session, biosample_id: int) -> Optional[BioSampleRead]:
@@ -85,4 +113,5 @@ def delete_biosample(session: Session, biosample_id: int) -> Optional[BioSampleR
         raise EntityNotFoundError(f"BioSample with id {biosample_id} not found")
     session.delete(biosample)
     session.commit()
+    invalidate_biosample_cache(biosample_id)
     return biosample
@@ -0,0 +1,223 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+CacheKey = Tuple[Hashable, ...]
+
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """
+    Snapshot of the counters kept by a cache backend.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to fall through to the database.
+        evictions (int): Entries dropped because the cache was full.
+        expirations (int): Entries dropped because their TTL elapsed.
+        invalidations (int): Entries dropped by explicit invalidation after a write.
+        size (int): Number of entries currently stored.
+        maxsize (int): Maximum number of entries the cache can hold.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheBackend(ABC):
+    """
+    Interface for result cache backends.
+
+    Keys are tuples whose first element is a namespace (e.g. "biosample:list"),
+    so that a whole family of entries can be dropped at once. A shared cache
+    (Redis, memcached, ...) can be plugged in by implementing these methods.
+
+    A hit costs a single get(). Only on a miss does a reader register its load
+    with generation() before querying the database, pass the returned
+    generation to set() and call release() when done. Invalidations advance
+    the generation of the keys being loaded, so set() drops a value loaded
+    across a write instead of caching stale data. Generations are only tracked
+    while a load is in flight, keeping that state bounded by the number of
+    concurrent loaders.
+    """
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> Any:
+        """Return the cached value for key, or MISSING."""
+
+    @abstractmethod
+    def generation(self, key: CacheKey) -> int:
+        """Register a load of key and return a counter that increases whenever key is invalidated meanwhile."""
+
+    @abstractmethod
+    def release(self, key: CacheKey) -> None:
+        """Unregister a load of key started with generation()."""
+
+    @abstractmethod
+    def set(self, key: CacheKey, value: Any, generation: int | None = None) -> None:
+        """Store value under key, unless generation is given and key has been invalidated since it was taken."""
+
+    @abstractmethod
+    def delete(self, key: CacheKey) -> None:
+        """Drop a single entry if present and advance its generation if it is being loaded."""
+
+    @abstractmethod
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop every entry whose key starts with namespace and advance the generation of its keys being loaded."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry and advance the generation of every key being loaded."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return a snapshot of hit/miss counters."""
+
+
+class InMemoryCache(CacheBackend):
+    """
+    Thread-safe in-process cache with LRU eviction and a per-entry TTL.
+
+    Args:
+        maxsize (int): Maximum number of entries kept before the least recently used is evicted.
+        ttl (float): Seconds an entry stays valid after being stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self._stats = CacheStats(maxsize=maxsize)
+        # key -> [number of loads in flight, generation]; entries are removed
+        # once the last load of the key is released.
+        self._loading: Dict[CacheKey, List[int]] = {}
+
+    def generation(self, key: CacheKey) -> int:
+        with self._lock:
+            loading = self._loading.setdefault(key, [0, 0])
+            loading[0] += 1
+            return loading[1]
+
+    def release(self, key: CacheKey) -> None:
+        with self._lock:
+            loading = self._loading.get(key)
+            if loading is not None:
+                loading[0] -= 1
+                if loading[0] <= 0:
+                    del self._loading[key]
+
+    def get(self, key: CacheKey) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: CacheKey, value: Any, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is not None:
+                loading = self._loading.get(key)
+                if loading is None or loading[1] != generation:
+                    return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: CacheKey) -> None:
+        with self._lock:
+            if key in self._loading:
+                self._loading[key][1] += 1
+            if self._data.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        with self._lock:
+            for key, loading in self._loading.items():
+                if key[0] == namespace:
+                    loading[1] += 1
+            stale = [key for key in self._data if key[0] == namespace]
+            for key in stale:
+                del self._data[key]
+            self._stats.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            for loading in self._loading.values():
+                loading[1] += 1
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                invalidations=self._stats.invalidations,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
+
+
+_backend: CacheBackend = InMemoryCache(
+    maxsize=int(os.getenv("CACHE_MAXSIZE", "1024")),
+    ttl=float(os.getenv("CACHE_TTL_SECONDS", "30")),
+)
+
+
+def get_cache() -> CacheBackend:
+    """Return the active cache backend."""
+    return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    """Replace the active cache backend (e.g. with a shared cache implementation)."""
+    global _backend
+    _backend = backend
+
+
+def cached(key: CacheKey, loader: Callable[[], Any]) -> Any:
+    """Return the cached value for key, calling loader() and storing its result on a miss."""
+    cache = get_cache()
+    value = cache.get(key)
+    if value is not MISSING:
+        return value
+    # Registered after the miss but before querying the database, so any write
+    # committed while the loader runs still invalidates this load.
+    generation = cache.generation(key)
+    try:
+        value = loader()
+        if value is not None:
+            cache.set(key, value, generation)
+    finally:
+        cache.release(key)
+    return value
+
@@ -4,6 +4,13 @@ from sqlalchemy import func
 from backend.services.exceptions import EntityNotFoundError
 from backend.models.comment import Comment
 from backend.schemas.comment import CommentCreate, CommentCreateWithoutId, CommentRead, CommentListResponse
+from backend.services.cache import cached, get_cache
+
+COMMENTS_NAMESPACE = "comment:list"
+
+def invalidate_comment_cache(biosample_id: int) -> None:
+    """Drop every cached comment page belonging to biosample_id."""
+    get_cache().invalidate_namespace(f"{COMMENTS_NAMESPACE}:{biosample_id}")
 
 def add_comment(session: Session, comment_data: CommentCreateWithoutId, biosample_id: int) -> CommentRead:
     """Create and return a new comment linked to a biosample."""
@@ -18,6 +25,7 @@ def add_comment(session: Session, comment_data: CommentCreateWithoutId, biosampl
     session.add(comment)
     session.commit()
     session.refresh(comment)
+    invalidate_comment_cache(biosample_id)
     return CommentRead.model_validate(comment)
 
 def get_comments(session: Session, biosample_id: int, offset: int = 0, limit: int = 10) -> CommentListResponse:
@@ -25,21 +33,25 @@ def get_comments(session: Session, biosample_id: int, offset: int = 0, limit: in
     from backend.services.biosample_service import get_biosample
     if not get_biosample(session, biosample_id):
         raise EntityNotFoundError(f"Biosample with id {biosample_id} not found")
-    stmt = (
-        select(Comment)
-        .where(Comment.biosample_id == biosample_id)
-        .order_by(Comment.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-    comments = session.exec(stmt).all()
 
-    count_stmt = select(func.count()).where(Comment.biosample_id == biosample_id)
-    total_count = session.exec(count_stmt).one()
+    def load() -> CommentListResponse:
+        stmt = (
+            select(Comment)
+            .where(Comment.biosample_id == biosample_id)
+            .order_by(Comment.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        comments = session.exec(stmt).all()
+
+        count_stmt = select(func.count()).where(Comment.biosample_id == biosample_id)
+        total_count = session.exec(count_stmt).one()
+
+        results = [CommentRead.model_validate(c) for c in comments]
 
-    results = [CommentRead.model_validate(c) for c in comments]
+        return CommentListResponse(results=results, total_count=total_count)
 
-    return CommentListResponse(results=results, total_count=total_count)
+    return cached((f"{COMMENTS_NAMESPACE}:{biosample_id}", offset, limit), load)
 
 def count_comments(session: Session, biosample_id: int) -> int:
     """Return the total number of comments for a biosample."""
@@ -52,3 +64,4 @@ def delete_comments_for_sample(session: Session, biosample_id: int) -> None:
     stmt = delete(Comment).where(Comment.biosample_id == biosample_id)
     session.exec(stmt)
     session.commit()
+    invalidate_comment_cache(biosample_id)
@@ -0,0 +1,25 @@
+from sqlmodel import Session, select
+from backend.models.location import Location
+
+def get_location_by_name(session: Session, name: str) -> Location | None:
+    """Retrieve a Location by name, or return None if not found."""
+    stmt = select(Location).where(Location.name == name)
+    return session.exec(stmt).first()
+
+def get_locations(session: Session) -> list[str]:
+    """Return all Locations in the database."""
+    stmt = select(Location.name)
+    return session.exec(stmt).all()
+
+def create_location_by_name(session: Session, name: str) -> Location:
+    """Create a new Location and return it."""
+    location = Location(name=name)
+    session.add(location)
+    session.commit()
+    session.refresh(location)
+    return location
+
+def get_or_create_location(session: Session, name: str) -> Location:
+    """Retrieve a Location by name, or create one if it doesn't exist."""
+    location = get_location_by_name(session, name)
+    return location if location else create_location_by_name(session, name)
@@ -0,0 +1,40 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from backend.middleware import admission
+
+
+class AdmissionGatesTest(unittest.TestCase):
+    @staticmethod
+    async def queue_bulk_requests():
+        gate = admission.get_gates()[admission.BULK]
+        assert await gate.acquire()
+        waiter = asyncio.ensure_future(gate.acquire())
+        await asyncio.sleep(0.05)  # let the waiter block on the semaphore
+        gate.release()
+        admitted = await waiter
+        gate.release()
+        return admitted
+
+    def test_gates_are_rebuilt_for_a_new_event_loop(self):
+        with mock.patch.dict(os.environ, {"ADMISSION_BULK_LIMIT": "1"}):
+            self.assertTrue(asyncio.run(self.queue_bulk_requests()))
+            self.assertTrue(asyncio.run(self.queue_bulk_requests()))
+
+    def test_environment_is_read_at_configuration(self):
+        async def configure():
+            admission.configure_admission()
+
+        with mock.patch.dict(os.environ, {"ADMISSION_READ_LIMIT": "3"}):
+            asyncio.run(configure())
+        self.assertEqual(admission.get_admission_stats()[admission.READ].limit, 3)
+
+    def test_zero_limit_is_rejected(self):
+        with self.assertRaises(ValueError):
+            admission.AdmissionGate(0, 5, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from backend.services.cache import InMemoryCache, MISSING, cached, get_cache, set_cache_backend
+
+
+class InMemoryCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.previous = get_cache()
+        self.cache = InMemoryCache(maxsize=16, ttl=60)
+        set_cache_backend(self.cache)
+
+    def tearDown(self):
+        set_cache_backend(self.previous)
+
+    def test_read_overlapping_a_write_is_not_cached(self):
+        def load_then_invalidate():
+            self.cache.delete(("biosample:detail", 1))
+            return "stale"
+
+        self.assertEqual(cached(("biosample:detail", 1), load_then_invalidate), "stale")
+        self.assertIs(self.cache.get(("biosample:detail", 1)), MISSING)
+        self.assertEqual(cached(("biosample:detail", 1), lambda: "fresh"), "fresh")
+        self.assertEqual(self.cache.get(("biosample:detail", 1)), "fresh")
+
+    def test_namespace_invalidation_during_load_is_not_cached(self):
+        def load_then_invalidate():
+            self.cache.invalidate_namespace("biosample:list")
+            return ["stale"]
+
+        cached(("biosample:list", 10, 0), load_then_invalidate)
+        self.assertIs(self.cache.get(("biosample:list", 10, 0)), MISSING)
+
+    def test_state_stays_bounded_after_many_writes(self):
+        for biosample_id in range(100_000):
+            cached(("biosample:detail", biosample_id), lambda: biosample_id)
+            self.cache.delete(("biosample:detail", biosample_id))
+            self.cache.invalidate_namespace(f"comment:list:{biosample_id}")
+            cached((f"comment:list:{biosample_id}", 0, 10), lambda: [])
+
+        self.assertLessEqual(len(self.cache._data), self.cache.maxsize)
+        self.assertEqual(len(self.cache._loading), 0)
+
+    def test_hit_does_not_take_a_generation(self):
+        cached(("biosample:detail", 1), lambda: "value")
+        calls = []
+        generation = self.cache.generation
+        self.cache.generation = lambda key: calls.append(key) or generation(key)
+
+        self.assertEqual(cached(("biosample:detail", 1), lambda: "other"), "value")
+        self.assertEqual(calls, [])
+
+    def test_failed_load_releases_its_registration(self):
+        def failing_loader():
+            raise RuntimeError("database unavailable")
+
+        with self.assertRaises(RuntimeError):
+            cached(("biosample:detail", 1), failing_loader)
+        self.assertEqual(len(self.cache._loading), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()